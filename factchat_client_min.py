@@ -18,37 +18,113 @@
 - 나머지 모델(grok, sonar, gemma 등)은 나중에 router에 분기 추가
 """
 
+from __future__ import annotations
+
 """
 [현재 동작 범위]
 - gpt-*  → openai/chat/completions + messages
 - claude-* → anthropic/messages + messages (+ max_tokens)
+- gpt-image-* → openai/images/generate + prompt (+ size)
 - 응답은 모두 LLMResponse(text, model, usage, raw)로 정규화
 
 [확인된 이슈 / 제약]
 - provider별 응답 포맷이 완전히 동일하지 않음
-  → 현재는 OpenAI chat.completion 형태를 기준으로 파싱
-  → Claude 전용 파싱 로직은 추후 필요 시 추가
+  → _ROUTES의 provider별 parser로 분리 (_parse_openai_chat / _parse_anthropic_messages / _parse_openai_image)
+  → Claude 응답이 OpenAI chat.completion 형태로 오면 그대로 OpenAI 파서로 처리
 - usage / finish_reason은 provider에 따라 없을 수 있음
 
 [TODO]
-- router(): 기타 모델 라우팅 분기 확장 
-  - gpt-image-*, grok-*, sonar-*, gemma-* 등
-- build_payload(): 기타 모델 페이로드 빌드 분기 확장
-- _parse_result(): provider별 응답 파싱 분기 확장
+- _ROUTES: 기타 모델 라우팅 / 페이로드 빌드 규칙 확장 
+  - grok-*, sonar-*, gemma-* 등
 - call(): 네트워크 에러 메시지 정규화
 - 선택적으로 CLI 진입점(__main__) 추가
 """
 
 
 
-from __future__ import annotations 
 import os
+import gzip
+import zlib
+import json
+import time
+import hashlib
+import logging
+import functools
+import asyncio
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from pathlib import Path
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, Tuple, List
+from typing import Optional, Dict, Any, Tuple, List, Union, Callable
+
+try:  # async 클라이언트용 선택 의존성 (sync만 쓰면 없어도 됨)
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+try:  # 큰 응답(이미지 base64 등) 증분 파싱용 선택 의존성
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+try:  # HTTP/2 transport용 선택 의존성 (pip install 'httpx[http2]')
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+try:  # httpx의 http2=True에 필요한 extra (없으면 httpx가 자체 ImportError를 던지므로 미리 확인)
+    import h2  # noqa: F401
+    _HAS_H2 = True
+except ImportError:  # pragma: no cover
+    _HAS_H2 = False
+
+# 요청 body 직렬화 / 응답 파싱: orjson 있으면 사용 (stdlib json보다 2~3배 빠름), 없으면 stdlib
+def _std_json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        # stdlib json이 받던 입력은 그대로 받아야 함 (LLMCache.make_key도 stdlib json 사용)
+        # - logit_bias={50256: -100}처럼 int key → OPT_NON_STR_KEYS로 "50256" (stdlib와 동일)
+        # - 64bit 넘는 int 등 orjson이 못 다루는 값 → stdlib로 fallback
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:  # orjson.JSONEncodeError는 TypeError의 하위 클래스
+            return _std_json_dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _json_dumps = _std_json_dumps
+    _json_loads = json.loads
 
 DEFAULT_BASE = "https://factchat-cloud.mindlogic.ai/v1/api"
 
+logger = logging.getLogger(__name__)
+
+# 재시도 정책: 모든 transport 공통 (requests는 urllib3 Retry, 나머지는 _send 안의 루프)
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.3
+_RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def _retry_backoff(retry: int, status: Optional[int] = None, headers: Optional[Any] = None) -> float:
+    """
+    retry번째 재시도 전 대기 시간 — urllib3 Retry(backoff_factor=0.3)과 동일 (0, 0.6, 1.2초)
+    429 / 503에 Retry-After(초)가 있으면 그 값을 따름
+    """
+    if status in (429, 503) and headers is not None:
+        retry_after = headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+    return 0.0 if retry <= 1 else _RETRY_BACKOFF * 2 ** (retry - 1)
+
 @dataclass
 class LLMResponse:  
     """ 
@@ -65,8 +141,253 @@ class LLMResponse:
     finish_reason: Optional[str]     # 'stop', 'length', 'content_filter', etc. # None if not applicable
     raw: Dict[str, Any]     # API 응답 JSON 원본
 
-class FactChatClient:
-    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, timeout: int = 60):
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0       # 캐시에 없어서 실제 HTTP 요청으로 이어진 횟수
+    coalesced: int = 0    # 같은 요청이 이미 진행 중이라 그 결과를 같이 받은 횟수 (HTTP 요청 없음)
+
+
+class MemoryLRU:
+    """
+    in-memory LRU 백엔드 (OrderedDict 기반)
+    - maxsize 넘으면 가장 오래 안 쓴 항목부터 제거
+    - dict 대신 직렬화된 bytes로 보관 → get마다 새 dict를 돌려주므로
+      호출자가 res.raw / res.usage를 수정해도 캐시 항목(과 이후 hit)은 그대로
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            self._data.move_to_end(key)
+        ts, blob = entry
+        return ts, _json_loads(blob)
+
+    def set(self, key: str, entry: Tuple[float, Dict[str, Any]]) -> None:
+        ts, raw = entry
+        blob = _json_dumps(raw)
+        with self._lock:
+            self._data[key] = (ts, blob)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+
+class DiskCache:
+    """
+    on-disk 백엔드: <root>/<key>.json.gz 파일 하나에 응답 하나
+    - 프로세스를 다시 띄워도 (테스트/스모크 체크 반복 실행) 캐시가 유지됨
+    """
+
+    def __init__(self, root: Union[str, Path] = ".factchat_cache"):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _file(self, key: str) -> Path:
+        return self.root / f"{key}.json.gz"
+
+    def get(self, key: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        f = self._file(key)
+        try:
+            with gzip.open(f, "rt", encoding="utf-8") as fp:
+                stored = json.load(fp)
+            return float(stored["ts"]), stored["raw"]
+        except (OSError, EOFError, zlib.error, ValueError, KeyError, TypeError):
+            # 없는 파일 / 깨진(잘린 gzip 포함) 파일 / 형식이 다른 파일은 모두 miss로 취급
+            return None
+
+    def set(self, key: str, entry: Tuple[float, Dict[str, Any]]) -> None:
+        ts, raw = entry
+        # 임시 파일 이름은 프로세스 / 스레드별로 분리 (같은 key를 동시에 써도 서로의 tmp를 건드리지 않게)
+        tmp = self.root / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with gzip.open(tmp, "wt", encoding="utf-8") as fp:
+                json.dump({"ts": ts, "raw": raw}, fp, ensure_ascii=False)
+            tmp.replace(self._file(key))  # 쓰다 만 파일을 읽지 않도록 rename으로 교체
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    def delete(self, key: str) -> None:
+        self._file(key).unlink(missing_ok=True)
+
+
+class LLMCache:
+    """
+    (model, payload, url) 해시 → API 응답 원본(raw) 캐시
+
+    의도:
+    - 같은 프롬프트("ping" smoke test, temperature=0 호출 등)를 다시 보내면
+      네트워크 왕복 / 토큰 비용 없이 이전 응답을 돌려줌
+    - raw만 저장하고 LLMResponse는 hit 시 provider parser로 다시 만든다
+    - backend는 get/set/delete만 있으면 교체 가능 (기본: MemoryLRU)
+    - 클라이언트 기본값은 캐시 꺼짐 (opt-in): FactChatClient(cache=LLMCache())
+      temperature 미지정 호출도 캐시되므로, 같은 답이 돌아와도 되는 경우에만 켤 것
+    """
+
+    DEFAULT_TTL = 7 * 24 * 60 * 60  # 7일
+
+    def __init__(self, backend: Optional[Any] = None, ttl: Optional[float] = DEFAULT_TTL, enabled: bool = True):
+        self.backend = backend if backend is not None else MemoryLRU()
+        self.ttl = ttl  # None이면 만료 없음
+        self.enabled = enabled
+        self.stats = CacheStats()
+        self._stats_lock = threading.Lock()  # call_many 스레드에서 동시에 카운트
+
+    @staticmethod
+    def make_key(model: str, payload: Dict[str, Any], url: str) -> str:
+        blob = json.dumps({"model": model, "payload": payload, "url": url}, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def cacheable(kwargs: Dict[str, Any]) -> bool:
+        """샘플링(temperature > 0)이나 stream 응답은 매번 결과가 달라지므로 캐시하지 않음"""
+        return (kwargs.get("temperature") or 0) <= 0 and not kwargs.get("stream", False)
+
+    def get(self, key: str, record_miss: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        record_miss=False: miss 카운트는 호출자가 record_miss() / record_coalesced()로 직접 기록
+        (클라이언트는 single-flight leader로 확정된 뒤에만 miss로 셈)
+        """
+        if not self.enabled:
+            return None
+        entry = self.backend.get(key)
+        if entry is not None and self.ttl is not None and time.time() - entry[0] > self.ttl:
+            self.backend.delete(key)
+            entry = None
+        if entry is None:
+            if record_miss:
+                self.record_miss()
+            return None
+        with self._stats_lock:
+            self.stats.hits += 1
+        return entry[1]
+
+    def record_miss(self) -> None:
+        with self._stats_lock:
+            self.stats.misses += 1
+
+    def record_coalesced(self) -> None:
+        with self._stats_lock:
+            self.stats.coalesced += 1
+
+    def set(self, key: str, raw: Dict[str, Any]) -> None:
+        """
+        best-effort 저장: 디스크 꽉 참 / 읽기 전용 디렉터리 등으로 저장에 실패해도
+        이미 받은(과금된) 응답을 잃지 않도록 예외를 올리지 않고 로그만 남김
+        """
+        if not self.enabled:
+            return
+        try:
+            self.backend.set(key, (time.time(), raw))
+        except Exception:
+            logger.warning("LLMCache: failed to store entry %s", key, exc_info=True)
+
+
+# ----------------------------------------------------------------------
+# provider별 payload builder — (model, user_text, **kwargs) -> payload
+# ----------------------------------------------------------------------
+PayloadBuilder = Callable[..., Dict[str, Any]]
+ResponseParser = Callable[[Dict[str, Any]], LLMResponse]
+Route = Tuple[str, str, PayloadBuilder, ResponseParser]  # (full url, provider, payload builder, parser)
+
+
+def _build_anthropic(model: str, user_text: str, **kwargs: Any) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {
+        "model": model,
+        "max_tokens": kwargs.pop("max_tokens", 256),
+        "messages": [{"role": "user", "content": user_text}]
+    }
+    payload.update(kwargs)
+    return payload
+
+
+def _build_openai(model: str, user_text: str, **kwargs: Any) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {
+        "model": model,
+        "messages": [{"role": "user", "content": user_text}],
+    }
+    payload.update(kwargs)
+    return payload
+
+
+def _build_image(model: str, user_text: str, **kwargs: Any) -> Dict[str, Any]:
+    # test_factchat.py에서 확인된 스키마: messages 대신 prompt + size
+    payload: Dict[str, Any] = {
+        "model": model,
+        "prompt": user_text,
+        "size": kwargs.pop("size", "1024x1024"),
+    }
+    payload.update(kwargs)
+    return payload
+
+
+# ----------------------------------------------------------------------
+# provider별 응답 parser — data -> LLMResponse
+# 정상 응답 경로는 직접 인덱싱, 스키마가 안 맞으면 한 번의 except로 debug fallback
+# (model / usage / finish_reason은 provider에 따라 원래 없을 수 있으므로 .get 유지)
+# ----------------------------------------------------------------------
+class _UnparsedResponse(LLMResponse):
+    """parser가 스키마를 못 맞춘 응답 (2xx지만 {"error": ...} 등) — 캐시에 저장하지 않음"""
+
+
+def _parse_fallback(data: Dict[str, Any]) -> LLMResponse:
+    # debug 용으로 원본 데이터 통째로 반환
+    return _UnparsedResponse(text=str(data), model=data.get("model", ""), usage=data.get("usage") or {}, finish_reason=None, raw=data)
+
+
+def _parse_openai_chat(data: Dict[str, Any]) -> LLMResponse:
+    try:
+        choice = data["choices"][0]
+        text = choice["message"]["content"] or ""
+        return LLMResponse(text=text, model=data.get("model", ""), usage=data.get("usage") or {},
+                           finish_reason=choice.get("finish_reason"), raw=data)
+    except (KeyError, IndexError, TypeError):
+        return _parse_fallback(data)
+
+
+def _parse_anthropic_messages(data: Dict[str, Any]) -> LLMResponse:
+    # Anthropic messages 포맷: content=[{"type": "text", "text": ...}, ...], stop_reason
+    try:
+        text = "".join(block["text"] for block in data["content"] if block["type"] == "text")
+        return LLMResponse(text=text, model=data.get("model", ""), usage=data.get("usage") or {},
+                           finish_reason=data.get("stop_reason"), raw=data)
+    except (KeyError, TypeError):
+        # FactChat이 OpenAI chat.completion 형태로 변환해서 돌려주는 경우
+        return _parse_openai_chat(data)
+
+
+def _parse_openai_image(data: Dict[str, Any]) -> LLMResponse:
+    # images 포맷: data=[{"url": ...} 또는 {"b64_json": ...}] → text에는 url(없으면 base64)
+    try:
+        item = data["data"][0]
+        text = item["url"] if "url" in item else item["b64_json"]
+        return LLMResponse(text=text or "", model=data.get("model", ""), usage=data.get("usage") or {},
+                           finish_reason=None, raw=data)
+    except (KeyError, IndexError, TypeError):
+        return _parse_fallback(data)
+
+
+class _FactChatBase:
+    """
+    sync / async 클라이언트가 공유하는 부분
+    - 설정(api_key, base_url, timeout), router, payload 빌드, 응답 파싱
+    - 네트워크 I/O가 없는 순수 로직만 두고, 전송 방식은 하위 클래스가 결정
+    """
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, timeout: int = 60,
+                 cache: Optional[LLMCache] = None):
         self.api_key = api_key or os.environ.get("FACTCHAT_API_KEY")
         if not self.api_key:
             raise RuntimeError("FACTCHAT_API_KEY missing")
@@ -75,14 +396,66 @@ class FactChatClient:
         self.base_url = (base_url or os.environ.get("FACTCHAT_BASE_URL") or DEFAULT_BASE).rstrip('/')
         self.timeout = timeout
 
+        # 호출마다 다시 만들 필요 없는 것들은 생성 시 한 번만 조립
+        # - 헤더: api_key가 바뀌지 않으므로 고정 (세션에 그대로 넘기고, 수정하지 않는다)
+        # - URL: route별 전체 URL (base_url은 이미 rstrip, path는 슬래시 없는 리터럴)
+        self._headers_cached: Dict[str, str] = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        self._urls: Dict[str, str] = {path: f"{self.base_url}/{path}" for _, path, _, _, _ in self._ROUTES}
+
+        # 응답 캐시: 기본은 꺼짐 (cache=None). 켜려면 LLMCache(), 디스크에 두려면 LLMCache(DiskCache(...))
+        self.cache = cache if cache is not None else LLMCache(enabled=False)
+
     def _headers(self) -> Dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self.api_key}", 
-            "Content-Type": "application/json"
-            }
+        return self._headers_cached
+
+    def _cache_key(self, model: str, payload: Dict[str, Any], url: str, provider: str,
+                   kwargs: Dict[str, Any]) -> Optional[str]:
+        """
+        캐시 / single-flight에 쓸 key (None이면 캐시도, 동일 요청 합치기도 하지 않음)
+        - 캐시가 꺼져 있으면 매 호출이 독립적인 요청이어야 하므로 None
+        - UNCACHED_PROVIDERS도 None
+        """
+        if not self.cache.enabled or provider in self.UNCACHED_PROVIDERS or not LLMCache.cacheable(kwargs):
+            return None
+        return LLMCache.make_key(model, payload, url)
+
+    # model prefix → (path, provider, payload builder, response parser)
+    # 더 구체적인 prefix가 먼저 매칭되도록 긴 것부터 나열 (gpt-image-* 가 gpt-* 보다 앞)
+    # 기타 모델 라우팅 규칙은 여기에 한 줄 추가하면 됨
+    _ROUTES: Tuple[Tuple[str, str, str, PayloadBuilder, ResponseParser], ...] = (
+        ("gpt-image-", "openai/images/generate", "openai_images", _build_image, _parse_openai_image),
+        ("claude-", "anthropic/messages", "anthropic", _build_anthropic, _parse_anthropic_messages),
+        ("gpt-", "openai/chat/completions", "openai", _build_openai, _parse_openai_chat),
+    )
+    # 캐시하지 않는 provider: 이미지 생성은 결과가 매번 다르고, 응답(b64_json)이 수 MB라
+    # MemoryLRU에 쌓이면 스트리밍 파싱으로 줄인 peak 메모리를 다시 잡아먹음
+    UNCACHED_PROVIDERS = frozenset({"openai_images"})
+
+    # provider → payload builder / parser (provider를 이미 알고 있을 때 route 매칭 생략용)
+    _BUILDERS: Dict[str, PayloadBuilder] = {provider: builder for _, _, provider, builder, _ in _ROUTES}
+    _PARSERS: Dict[str, ResponseParser] = {provider: parser for _, _, provider, _, parser in _ROUTES}
+
+    @classmethod
+    @functools.lru_cache(maxsize=64)
+    def _match_route(cls, model: str) -> Tuple[str, str, PayloadBuilder, ResponseParser]:
+        # 같은 model 문자열은 두 번째 호출부터 dict probe 한 번으로 끝남
+        # (.lower() / prefix 비교도 model 문자열당 최초 1회만 실행됨)
+        m = model.lower()
+        for prefix, path, provider, builder, parser in cls._ROUTES:
+            if m.startswith(prefix):
+                return path, provider, builder, parser
+        raise ValueError(f"Unsupported model: {model}")
+
+    def _resolve(self, model: str) -> Route:
+        """model → (full url, provider, payload builder, parser)를 한 번에 결정"""
+        path, provider, builder, parser = self._match_route(model)
+        return self._urls[path], provider, builder, parser
 
     def router(self, model: str) -> Tuple[str, str]:
-          """
+        """
             model 이름을 기준으로
             - 어떤 엔드포인트(path)로 보낼지
             - 어떤 provider(openai / anthropic)를 쓸지
@@ -91,71 +464,178 @@ class FactChatClient:
             의도:
             - 외부에서는 model 문자열만 신경 쓰게 하고
             - 엔드포인트 차이('openai/chat/completions' vs 'anthropic/messages')는 이 함수 안으로 완전히 숨긴다
-            - 나중에 모델이 추가되면 if/elif 분기만 늘리면 됨
+            - 나중에 모델이 추가되면 _ROUTES에 한 줄만 늘리면 됨
         """
-        m = model.lower()
-        if m.startswith("claude-"):
-            return "anthropic/messages", "anthropic"
-        
-        elif m.startswith("gpt-"):
-            return "openai/chat/completions", "openai" 
+        path, provider, _, _ = self._match_route(model)
+        return path, provider
 
-        else:
-            raise ValueError(f"Unsupported model: {model}")
-
-        # 기타 모델 라우팅 규칙 추가 가능
-
-    def build_payload(self, model: str, user_text: str, **kwargs: Any) -> Dict[str, Any]:
+    def build_payload(self, model: str, user_text: str, provider: Optional[str] = None, **kwargs: Any) -> Dict[str, Any]:
         """ 
         provider 별로 body schema 맞춰 빌드 
         
         의도: 
-        - router에서 결정된 provider를 기준으로 payload 구조를 명시적으로 분기
-        - 'messages' / 'max_tokens' 같은 차이를 이 함수 안에서만 처리
+        - _ROUTES에서 결정된 provider별 builder로 payload 구조를 만든다
+        - 'messages' / 'max_tokens' 같은 차이는 _build_* 함수 안에서만 처리
         -  call()에서는 payload 구조를 신경 쓰지 않게 함
+        - router()로 provider를 이미 구했으면 넘겨서 route 매칭을 다시 하지 않게 함
         """
-        _, provider = self.router(model)
+        if provider is None:
+            _, provider, builder, _ = self._match_route(model)
+        else:
+            builder = self._BUILDERS.get(provider)
+            if builder is None:
+                raise ValueError(f"Unsupported provider: {provider}")
+        return builder(model, user_text, **kwargs)
 
-        if provider == "anthropic":
-            payload: Dict[str, Any] = {
-                "model": model,
-                "max_tokens": kwargs.pop("max_tokens", 256),
-                "messages": [{"role": "user", "content": user_text}]
-            }
-            payload.update(kwargs)
-            return payload
+    def _parse_result(self, provider: str, data: Dict[str, Any]) -> LLMResponse:
+        """
+        provider별 parser로 응답을 LLMResponse로 정규화
+        (call() 경로는 route에서 parser를 바로 받으므로, 외부 호출 / 디버깅용)
+        """
+        parser = self._PARSERS.get(provider)
+        if parser is None:
+            return _parse_fallback(data)
+        return parser(data)
 
-        elif provider == "openai":
-            payload: Dict[str, Any] = {
-                "model": model,
-                "messages": [{"role": "user", "content": user_text}],
-            }
-            payload.update(kwargs)
-            return payload
 
-        else:
-            raise ValueError(f"Unsupported provider: {provider}")
+class FactChatClient(_FactChatBase):
+    """
+    sync 클라이언트
 
-        # 기타 모델 페이로드 빌드 규칙 추가 가능
+    transport:
+    - "requests" (기본): requests.Session + 커넥션 풀 + POST 재시도
+    - "httpx": httpx.Client(http2=True) → 같은 호스트로 가는 요청을 TLS 커넥션 하나에 multiplex
+      (pip install 'httpx[http2]' 필요)
 
-    def _parse_result(self, provider: str, data: Dict[str, Any]) -> LLMResponse:
+    재시도는 transport와 관계없이 동일:
+    - 429 / 5xx(500, 502, 503, 504)와 연결·읽기 에러를 최대 3번 재시도 (0, 0.6, 1.2초 backoff)
+    - 재시도를 다 쓰면 마지막 상태 코드로 HTTPError를 던짐
+    """
+
+    TRANSPORTS = ("requests", "httpx")
+    # 응답 body가 큰 provider: body 전체를 bytes로 들고 있지 않고 소켓에서 바로 증분 파싱
+    # (bytes + dict 이중 보관으로 peak 메모리가 두 배가 되는 것 방지)
+    STREAMED_PROVIDERS = frozenset({"openai_images"})
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, timeout: int = 60,
+                 cache: Optional[LLMCache] = None, transport: str = "requests"):
+        super().__init__(api_key=api_key, base_url=base_url, timeout=timeout, cache=cache)
+        if transport not in self.TRANSPORTS:
+            raise ValueError(f"Unsupported transport: {transport}")
+        self.transport = transport
+        self._session: Optional[requests.Session] = None
+        self._client: Optional["httpx.Client"] = None
+        # single-flight: 캐시 key → 진행 중인 요청의 Future (같은 요청이 동시에 오면 HTTP는 1번만)
+        self._inflight: Dict[str, "Future[Dict[str, Any]]"] = {}
+        self._inflight_lock = threading.Lock()
+
+        if transport == "httpx":
+            if httpx is None or not _HAS_H2:
+                raise RuntimeError("httpx[http2] missing (pip install 'httpx[http2]')")
+            self._client = httpx.Client(
+                http2=True,
+                timeout=self.timeout,
+                headers=self._headers(),
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+            return
+
+        # 호출마다 TCP/TLS handshake를 다시 하지 않도록 Session(keep-alive 커넥션 풀)을 재사용
+        self._session = requests.Session()
+        retry = Retry(
+            total=_RETRY_TOTAL,
+            backoff_factor=_RETRY_BACKOFF,
+            status_forcelist=sorted(_RETRY_STATUS),
+            allowed_methods=["POST"],
+            # 재시도를 다 써도 마지막 응답을 그대로 돌려줌 → raise_for_status()가
+            # 기존처럼 HTTPError(.response 포함)를 던지게 (RetryError로 바뀌지 않게)
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # 인증 헤더는 세션에 한 번만 설정 (호출마다 다시 만들지 않음)
+        self._session.headers.update(self._headers())
+
+        # route URL별 PreparedRequest 템플릿 + 환경 설정(proxy / verify 등)을 미리 만들어 둠
+        # → 호출마다 Request 생성 / 헤더 merge / 환경변수 조회를 건너뛰고 body만 바꿔서 send
+        # 쿠키는 서버가 나중에 심는 것(LB stickiness 등)이 있으므로 _send에서 매번 세션 쿠키로 다시 설정
+        # 제약: proxy / verify 등 환경변수(HTTPS_PROXY, REQUESTS_CA_BUNDLE ...)는 생성 시점 값으로 고정됨
+        self._prepped: Dict[str, Tuple[requests.PreparedRequest, Dict[str, Any]]] = {}
+        for url in self._urls.values():
+            prepped = self._session.prepare_request(requests.Request("POST", url))
+            settings = self._session.merge_environment_settings(url, {}, None, None, None)
+            self._prepped[url] = (prepped, settings)
+
+    def close(self) -> None:
+        """세션이 잡고 있는 커넥션 풀 정리"""
+        if self._client is not None:
+            self._client.close()
+        if self._session is not None:
+            self._session.close()
+
+    def __enter__(self) -> "FactChatClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _post_httpx(self, url: str, body: bytes, timeout: float) -> "httpx.Response":
+        """httpx transport POST + requests 경로(urllib3 Retry)와 같은 재시도 정책"""
+        for retry in range(1, _RETRY_TOTAL + 2):
+            last = retry > _RETRY_TOTAL
+            try:
+                response = self._client.post(url, content=body, timeout=timeout)
+            except httpx.TransportError:
+                if last:
+                    raise
+                time.sleep(_retry_backoff(retry))
+                continue
+            if last or response.status_code not in _RETRY_STATUS:
+                return response
+            time.sleep(_retry_backoff(retry, response.status_code, response.headers))
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _send(self, url: str, payload: Dict[str, Any], timeout: Optional[float] = None,
+              stream: bool = False) -> Dict[str, Any]:
         """
-        chatgpt-* 형태 기준으로 파싱
-        claude-* 형태 등 기타 모델 응답 포맷이 다르면 provider == 'anthropic' 분기에서 추가 파싱
+        transport별 HTTP POST → 응답 JSON (HTTP 에러는 그대로 raise)
+        - stream=True: requests transport + ijson 있으면 response.raw에서 증분 파싱
+          (없으면 기존처럼 버퍼링 후 파싱)
         """
+        # json= 대신 직접 직렬화한 bytes 전송 (Content-Type은 세션 헤더에 이미 있음)
+        body = _json_dumps(payload)
+        timeout = timeout if timeout is not None else self.timeout
+        if self._client is not None:
+            response = self._post_httpx(url, body, timeout)
+            response.raise_for_status()
+            return _json_loads(response.content)
 
-        if "choices" in data and data.get("choices"):
-            msg = data["choices"][0].get("message", {}) or {}
-            text = msg.get("content", "") or ""
-            finish = data["choices"][0].get("finish_reason", None)
-            usage = data.get("usage", {}) or {}
-            model = data.get("model", "") or ""
-            return LLMResponse(text=text, model=model, usage=usage, finish_reason=finish, raw=data)
-        
-        # Claude 응답 포맷이 다르면 여기서 추가 파싱(필요 시 확장)
+        template, settings = self._prepped[url]
+        prepped = template.copy()
+        prepped.body = body
+        prepped.headers["Content-Length"] = str(len(body))
+        # Session.post처럼 현재 세션 쿠키를 반영 (이미 Cookie 헤더가 있으면 prepare_cookies가 덮어쓰지 않음)
+        prepped.headers.pop("Cookie", None)
+        prepped.prepare_cookies(self._session.cookies)
 
-        # debug 용으로 원본 데이터 통째로 반환
-        return LLMResponse(text=str(data), model=data.get("model", ""), usage=data.get("usage", {}) or {}, finish_reason=None, raw=data)
+        # with 블록으로 응답을 바로 닫아서 커넥션을 풀에 빨리 돌려줌
+        with self._session.send(prepped, timeout=timeout, **{**settings, "stream": stream}) as response:
+            response.raise_for_status()
+            # 깨진 body는 기존 response.json()과 같은 requests.exceptions.JSONDecodeError로 맞춤
+            # (RequestException이면서 json.JSONDecodeError / ValueError의 하위 클래스)
+            if stream and ijson is not None:
+                response.raw.decode_content = True  # gzip 등 Content-Encoding은 urllib3가 풀어서 전달
+                try:
+                    return next(ijson.items(response.raw, "", use_float=True))
+                except ijson.JSONError as e:
+                    raise requests.exceptions.JSONDecodeError(
+                        f"Invalid JSON response body ({str(e).splitlines()[0]})", "", 0, response=response) from e
+            try:
+                return _json_loads(response.content)
+            except ValueError as e:  # json / orjson JSONDecodeError
+                raise requests.exceptions.JSONDecodeError(
+                    getattr(e, "msg", str(e)), getattr(e, "doc", ""), getattr(e, "pos", 0), response=response) from e
 
     def call(self, model: str, user_text: str, **kwargs: Any) -> LLMResponse:
         
@@ -163,22 +643,283 @@ class FactChatClient:
         외부에서 호출하는 단일 진입점
 
         흐름:
-        1. model → router → path / provider 결정
-        2. provider → payload 스키마 생성
-        3. HTTP POST 요청
-        4. 응답을 LLMResponse로 정규화해서 반환
+        1. model → _resolve → url / provider / builder / parser 한 번에 결정
+        2. builder → payload 스키마 생성
+        3. 캐시 hit이면 HTTP 요청 없이 저장된 응답 사용
+           같은 요청이 이미 진행 중이면 (single-flight) 그 결과를 같이 받음
+        4. HTTP POST 요청 (miss 시 결과를 캐시에 저장)
+        5. provider parser로 응답을 LLMResponse로 정규화해서 반환
 
         의도:
         - 이 함수만 보면 "모델 + 텍스트 → 응답"으로 보이게 만들기
         - 내부 복잡성(path, payload 차이)은 전부 숨김
+
+        예외:
+        - HTTP 에러: transport의 HTTPError (requests.HTTPError / httpx.HTTPStatusError)
+        - 2xx인데 body가 JSON이 아님: requests transport는 requests.exceptions.JSONDecodeError,
+          httpx transport는 json.JSONDecodeError (둘 다 ValueError의 하위 클래스)
+        """
+        return self._call(self._resolve(model), model, user_text, kwargs)
+
+    def call_many(self, reqs: List[Tuple[str, str, Dict[str, Any]]], max_workers: int = 8,
+                  timeout: Optional[float] = None) -> List[Union[LLMResponse, BaseException]]:
+        """
+        여러 요청을 thread pool로 동시에 보내고, 입력 순서대로 결과 반환
+
+        - reqs: [(model, user_text, kwargs), ...]
+        - route는 보내기 전에 한 번에 결정 (지원 안 하는 model이면 아무것도 보내지 않고 ValueError)
+        - 개별 요청이 실패하면 그 자리에 예외 객체가 들어감 (asyncio.gather(return_exceptions=True)와 동일)
+        - timeout: 요청별 timeout (없으면 self.timeout)
         """
+        routes = [self._resolve(model) for model, _, _ in reqs]
+        results: List[Union[LLMResponse, BaseException]] = [None] * len(reqs)  # type: ignore[list-item]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(self._call, route, model, user_text, kwargs, timeout): i
+                for i, (route, (model, user_text, kwargs)) in enumerate(zip(routes, reqs))
+            }
+            for fut in as_completed(futures):
+                i = futures[fut]
+                try:
+                    results[i] = fut.result()
+                except Exception as e:
+                    results[i] = e
+        return results
+
+    def _call(self, route: Route, model: str, user_text: str, kwargs: Dict[str, Any],
+              timeout: Optional[float] = None) -> LLMResponse:
+        """route가 이미 결정된 요청 1건 처리 (call / call_many 공통)"""
+        url, provider, builder, parser = route
+        payload = builder(model, user_text, **kwargs)
+
+        key = self._cache_key(model, payload, url, provider, kwargs)
+        if key is not None:
+            cached = self.cache.get(key, record_miss=False)
+            if cached is not None:
+                return parser(cached)
+
+        if key is None:
+            return parser(self._send(url, payload, timeout, stream=provider in self.STREAMED_PROVIDERS))
+
+        # 같은 key 요청이 이미 진행 중이면 그 결과를 기다림 (캐시에 들어가기 전 race 구간 커버)
+        with self._inflight_lock:
+            fut = self._inflight.get(key)
+            leader = fut is None
+            if leader:
+                fut = Future()
+                self._inflight[key] = fut
+        if leader:
+            self.cache.record_miss()
+        else:
+            self.cache.record_coalesced()
+            # leader는 성공/실패와 관계없이 항상 fut를 완료시키므로 여기서 별도 timeout은 두지 않음
+            # (leader 쪽 HTTP timeout + 재시도가 대기 시간의 상한)
+            return parser(fut.result())
+
+        try:
+            data = self._send(url, payload, timeout, stream=provider in self.STREAMED_PROVIDERS)
+        except BaseException as e:
+            fut.set_exception(e)
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            raise
+        # 결과를 먼저 확정해서 기다리는 쪽에 넘긴 뒤 캐시에 저장 (저장은 best-effort, 실패해도 raise 안 함)
+        fut.set_result(data)
+        try:
+            result = parser(data)
+            if not isinstance(result, _UnparsedResponse):
+                self.cache.set(key, data)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+        return result
+
+
+class AsyncFactChatClient(_FactChatBase):
+    """
+    FactChatClient의 async 버전
+
+    의도:
+    - 여러 모델 / 여러 프롬프트를 asyncio.gather()로 동시에 보내기 위함
+      → 전체 대기 시간이 Σ(latency)가 아니라 max(latency)에 가까워짐
+    - router / build_payload / _parse_result는 sync 클라이언트와 그대로 공유
+
+    transport:
+    - "aiohttp" (기본): aiohttp.ClientSession
+    - "httpx": httpx.AsyncClient(http2=True)
+    - 재시도 정책은 transport와 관계없이 FactChatClient와 동일
+
+    사용:
+        async with AsyncFactChatClient() as fc:
+            res = await fc.call("gpt-5-mini", "ping")
+    """
+
+    TRANSPORTS = ("aiohttp", "httpx")
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, timeout: int = 60,
+                 cache: Optional[LLMCache] = None, transport: str = "aiohttp"):
+        super().__init__(api_key=api_key, base_url=base_url, timeout=timeout, cache=cache)
+        if transport not in self.TRANSPORTS:
+            raise ValueError(f"Unsupported transport: {transport}")
+        if transport == "aiohttp" and aiohttp is None:
+            raise RuntimeError("aiohttp missing (pip install aiohttp)")
+        if transport == "httpx" and (httpx is None or not _HAS_H2):
+            raise RuntimeError("httpx[http2] missing (pip install 'httpx[http2]')")
+        self.transport = transport
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._client: Optional["httpx.AsyncClient"] = None
+        # single-flight: 캐시 key → 진행 중인 요청 task (lock은 event loop 안에서 생성)
+        self._inflight: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+        self._inflight_lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self) -> "AsyncFactChatClient":
+        # 세션은 실행 중인 event loop 안에서 만들어야 하므로 __aenter__에서 생성
+        self._inflight_lock = asyncio.Lock()
+        if self.transport == "httpx":
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                headers=self._headers(),
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=10),
+            )
+        else:
+            self._session = aiohttp.ClientSession(
+                headers=self._headers(),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+            )
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """세션이 잡고 있는 커넥션 풀 정리"""
+        # 아직 진행 중인 공유 요청은 세션을 닫기 전에 취소
+        for task in list(self._inflight.values()):
+            task.cancel()
+        self._inflight.clear()  # 시작도 못 하고 취소된 task는 finally가 돌지 않으므로 직접 비움
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _send(self, url: str, payload: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        transport별 HTTP POST → 응답 JSON (HTTP 에러는 그대로 raise)
+        재시도 정책은 sync 클라이언트와 동일 (429 / 5xx, 연결·읽기 에러 최대 3번)
+        """
+        body = _json_dumps(payload)
+        for retry in range(1, _RETRY_TOTAL + 2):
+            last = retry > _RETRY_TOTAL
+            try:
+                status, headers, data = await self._post_once(url, body, timeout, raise_status=last)
+            except self._retry_errors():
+                if last:
+                    raise
+                await asyncio.sleep(_retry_backoff(retry))
+                continue
+            if data is not None:
+                return data
+            await asyncio.sleep(_retry_backoff(retry, status, headers))
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _retry_errors(self) -> Tuple[type, ...]:
+        """재시도할 transport 에러 (HTTP 상태 에러는 포함하지 않음)"""
+        if self._client is not None:
+            return (httpx.TransportError,)
+        return (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+    async def _post_once(self, url: str, body: bytes, timeout: Optional[float],
+                         raise_status: bool) -> Tuple[int, Any, Optional[Dict[str, Any]]]:
+        """
+        POST 1번 → (status, headers, data)
+        - 재시도 대상 상태 코드이고 raise_status=False면 data=None (호출자가 재시도)
+        - 그 외 HTTP 에러는 raise, 성공이면 파싱한 JSON
+        """
+        if self._client is not None:
+            response = await self._client.post(url, content=body, timeout=timeout if timeout is not None else self.timeout)
+            if response.status_code in _RETRY_STATUS and not raise_status:
+                return response.status_code, response.headers, None
+            response.raise_for_status()
+            return response.status_code, response.headers, _json_loads(response.content)
+
+        # timeout 지정이 없으면 세션 기본값(ClientTimeout(total=self.timeout)) 사용
+        extra: Dict[str, Any] = {} if timeout is None else {"timeout": aiohttp.ClientTimeout(total=timeout)}
+        # aiohttp의 json_serialize는 str을 요구하므로, bytes로 직접 직렬화해서 data=로 전송
+        async with self._session.post(url, data=body, **extra) as response:
+            if response.status in _RETRY_STATUS and not raise_status:
+                return response.status, response.headers, None
+            response.raise_for_status()
+            return response.status, response.headers, _json_loads(await response.read())
+
+    async def call(self, model: str, user_text: str, **kwargs: Any) -> LLMResponse:
+        """
+        FactChatClient.call()과 동일한 흐름, HTTP 요청만 await
+        """
+        self._ensure_open()
+        return await self._call(self._resolve(model), model, user_text, kwargs)
+
+    async def call_many(self, reqs: List[Tuple[str, str, Dict[str, Any]]],
+                        timeout: Optional[float] = None) -> List[Union[LLMResponse, BaseException]]:
+        """
+        FactChatClient.call_many()의 async 버전: asyncio.gather로 동시에 보냄
+        - 동시 요청 수 상한은 커넥션 풀(limit=32) 설정을 따름
+        - 개별 요청이 실패하면 그 자리에 예외 객체가 들어감
+        """
+        self._ensure_open()
+        routes = [self._resolve(model) for model, _, _ in reqs]
+        tasks = [
+            self._call(route, model, user_text, kwargs, timeout)
+            for route, (model, user_text, kwargs) in zip(routes, reqs)
+        ]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _ensure_open(self) -> None:
+        if self._session is None and self._client is None:
+            raise RuntimeError("AsyncFactChatClient must be used with 'async with'")
+
+    async def _call(self, route: Route, model: str, user_text: str, kwargs: Dict[str, Any],
+                    timeout: Optional[float] = None) -> LLMResponse:
+        """route가 이미 결정된 요청 1건 처리 (call / call_many 공통)"""
+        url, provider, builder, parser = route
+        payload = builder(model, user_text, **kwargs)
+
+        key = self._cache_key(model, payload, url, provider, kwargs)
+        if key is not None:
+            cached = self.cache.get(key, record_miss=False)
+            if cached is not None:
+                return parser(cached)
 
-        path, provider = self.router(model)
-        url = f"{self.base_url}/{path.lstrip('/')}"
-        payload = self.build_payload(model, user_text, **kwargs)
+        if key is None:
+            return parser(await self._send(url, payload, timeout))
 
-        response = requests.post(url, headers=self._headers(), json=payload, timeout=self.timeout)
-        response.raise_for_status()
-        data = response.json()
+        # 같은 key 요청이 이미 진행 중이면 그 task 결과를 같이 기다림 (캐시에 들어가기 전 race 구간 커버)
+        # 실제 HTTP 요청은 호출자와 분리된 task로 실행 → 먼저 온 호출자가 cancel돼도 요청은 계속 진행
+        async with self._inflight_lock:
+            task = self._inflight.get(key)
+            if task is None:
+                self.cache.record_miss()
+                task = asyncio.ensure_future(self._send_shared(key, url, payload, parser, timeout))
+                # 기다리는 호출자가 모두 cancel된 경우 "exception was never retrieved" 경고 방지
+                task.add_done_callback(lambda t: t.cancelled() or t.exception())
+                self._inflight[key] = task
+            else:
+                self.cache.record_coalesced()
+        # shield: 호출자 하나가 cancel돼도(wait_for timeout 등) 공유 task와 다른 호출자는 영향 없음
+        return parser(await asyncio.shield(task))
 
-        return self._parse_result(provider, data)
\ No newline at end of file
+    async def _send_shared(self, key: str, url: str, payload: Dict[str, Any], parser: ResponseParser,
+                           timeout: Optional[float]) -> Dict[str, Any]:
+        """single-flight로 공유되는 HTTP 요청 1건 (성공 시 parser가 이해한 응답만 캐시에 저장)"""
+        try:
+            data = await self._send(url, payload, timeout)
+            # 캐시 저장은 best-effort (LLMCache.set은 실패해도 raise 안 함) → 받은 응답은 항상 반환
+            if not isinstance(parser(data), _UnparsedResponse):
+                self.cache.set(key, data)
+            return data
+        finally:
+            self._inflight.pop(key, None)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# run_chat_async.py
+"""
+[의도]
+- AsyncFactChatClient가 정상 동작하는지 빠르게 확인하기 위한 실행 스크립트
+- 여러 모델에 같은 요청을 asyncio.gather()로 동시에 보낸다
+
+[역할]
+- run_chat.py의 async 버전 (테스트/디버깅용 진입점)
+- 모든 핵심 로직은 factchat_client_min.py에만 둔다
+
+[사용 시나리오]
+- 여러 모델 호출이 동시에 나가는지 (전체 시간 ≈ 가장 느린 모델 한 번) 확인
+"""
+
+import asyncio
+
+from factchat_client_min import AsyncFactChatClient
+
+# 동시에 호출할 모델 목록
+models = ["gpt-5-mini", "claude-sonnet-4-5"]
+
+
+async def main() -> None:
+    # API Key, Base URL 등은 환경변수에서 자동 로드됨
+    async with AsyncFactChatClient() as fc:
+        results = await asyncio.gather(*[fc.call(m, "ping") for m in models])
+
+    # 모델별 최종 텍스트만 출력
+    for m, res in zip(models, results):
+        print(f"{m}: {res.text}")
+
+
+asyncio.run(main())
@@ -55,8 +55,12 @@ payload = {
         "size": "1024x1024",
     }
 
+# 세션 재사용 -> path/model 바꿔가며 여러 번 보낼 때 커넥션(TCP/TLS) 재활용
+session = requests.Session()
+session.headers.update(headers)
+
 # FactChat API에 POST 요청 보내기
-r = requests.post(url, headers=headers, json=payload, timeout=180) # POST 요청 보내기
+r = session.post(url, json=payload, timeout=180) # POST 요청 보내기
 print(r.status_code) # 서버 응답 상태 확인
 print(r.text[:500]) # 응답 내용 일부 확인
 # debug용 출력